@@ -9,6 +9,7 @@ Key Functions:
 - `configure_browser`: Configures the browser to use for the OAuth2 flow.
 - `request_credentials`: Requests credentials from the user by running the OAuth2 flow locally.
 - `get_credentials`: Retrieves saved credentials from the token file or requests new credentials if needed.
+- `create_authorized_http`: Creates an authorized HTTP connection (one is needed per thread).
 - `create_service`: Creates a Google API service client for interacting with a specific API (e.g., Google Drive).
 
 The module uses OAuth2 authentication via the Google API client library, saving credentials to a token 
@@ -18,11 +19,13 @@ Constants:
 - `CLIENT_SECRETS_FILE`: Path to the client secrets JSON file for OAuth2 authentication.
 - `TOKEN_FILE`: Path to the token file where OAuth2 credentials are stored.
 - `API_VERSION`: Version of the Google API to use (currently v3 for Google Drive).
+- `CURRENT_OS`: Name of the operating system the script is running on.
 - `API_SERVICES`: Dictionary containing API service names and corresponding scopes.
 
 Dependencies:
 - googleapiclient
 - google-auth
+- google-auth-httplib2
 - google-auth-oauthlib
 
 Usage:
@@ -37,7 +40,6 @@ import platform
 import webbrowser
 
 from typing import Any
-from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -46,6 +48,8 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 CLIENT_SECRETS_FILE: str = "client-secrets-file.json"
 TOKEN_FILE: str = "token.json"
 API_VERSION: str = "v3"
+# Operating system the script is running on, detected once at import time
+CURRENT_OS: str = platform.system()
 
 # Define the API services and scopes needed for authentication
 API_SERVICES: dict[str, dict[str, Any]] = {
@@ -77,20 +81,23 @@ def configure_browser() -> None:
     This function registers Google Chrome as the default browser to handle the OAuth2
     process, allowing the user to log in and grant permissions. It detects the current
     operating system (Windows, macOS, or Linux) and sets the correct browser path.
+    The browser is left as is if the user has chosen one with the BROWSER environment
+    variable, or if there is no display to open a browser on (Linux).
     """
-    current_os = platform.system()
+    if os.environ.get("BROWSER") or (CURRENT_OS == "Linux" and not os.environ.get("DISPLAY")):
+        return
 
-    if current_os == "Windows":
+    if CURRENT_OS == "Windows":
         # Windows: Default Chrome installation path
         browser_path = "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"
-    elif current_os == "Darwin":
+    elif CURRENT_OS == "Darwin":
         # macOS: Default Chrome installation path for macOS
         browser_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-    elif current_os == "Linux":
+    elif CURRENT_OS == "Linux":
         # Linux: Default Chrome executable (assuming Chrome is installed in the PATH)
         browser_path = "/usr/bin/google-chrome"
     else:
-        print(f"Unsupported operating system: {current_os}")
+        print(f"Unsupported operating system: {CURRENT_OS}")
         return
 
     if os.path.exists(browser_path):
@@ -124,7 +131,7 @@ def request_credentials(scopes: list[str]) -> Credentials:
         # Save credentials to a token file for later use
         with open(TOKEN_FILE, "w", encoding="utf-8") as token:
             token.write(creds.to_json())
-        return Credentials.from_authorized_user_file(TOKEN_FILE, scopes)
+        return creds
 
     print("Credentials file not present.")
     sys.exit(1)  # Exit if the credentials file does not exist
@@ -142,7 +149,8 @@ def get_credentials(service_name):
         Credentials: OAuth2 credentials object.
 
     The function checks if the token file exists and reads from it. If the credentials 
-    are expired but have a refresh token, it will refresh them automatically.
+    are expired but have a refresh token, it will refresh them automatically and save 
+    the refreshed token back to the token file.
     """
     scopes: list[str] = API_SERVICES[service_name]["scopes"]
     if os.path.exists(TOKEN_FILE):
@@ -151,30 +159,62 @@ def get_credentials(service_name):
         # Refresh the token if it has expired
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
+            # Save the refreshed credentials, but keep using the object already in memory
+            with open(TOKEN_FILE, "w", encoding="utf-8") as token:
+                token.write(creds.to_json())
         return creds
 
     # Request new credentials if token file is not found
     return request_credentials(scopes)
 
 
-def create_service(api_service_name: str):
+def create_authorized_http(credentials: Credentials):
+    """
+    Creates an authorized HTTP connection.
+
+    Args:
+        credentials (Credentials): OAuth2 credentials used to authorize the requests.
+
+    Returns:
+        google_auth_httplib2.AuthorizedHttp: An authorized HTTP connection.
+    """
+    # Import lazily, as the HTTP client libraries are only needed once a service is created
+    # pylint: disable=import-outside-toplevel
+    import httplib2
+    import google_auth_httplib2
+
+    http = httplib2.Http()
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+
+
+def create_service(api_service_name: str, credentials: Credentials | None = None):
     """
     Creates a service object for interacting with a Google API.
 
     Args:
         api_service_name (str): The name of the API service to create (e.g., 'drive').
+        credentials (Credentials | None): OAuth2 credentials to use, retrieved with
+            `get_credentials` if not given.
 
     Returns:
         googleapiclient.discovery.Resource: A service object for the Google API.
 
     The function retrieves the appropriate credentials and uses them to build a 
     service object that can be used to interact with Google APIs (such as Google Drive).
+    All requests made through the service share one HTTP connection.
     """
     # Get service configuration and credentials
     api_service: str = API_SERVICES.get(api_service_name.lower(), None)
     service_name: str = api_service["service_name"]
-    credentials: Credentials = get_credentials(service_name)
+    if credentials is None:
+        credentials = get_credentials(service_name)
+
+    # Imported here so that importing this module alone doesn't load the API client library
+    from googleapiclient.discovery import build  # pylint: disable=import-outside-toplevel
+
+    # Reuse a single authorized HTTP connection for all requests
+    authorized_http = create_authorized_http(credentials)
 
     # Build and return the service object
-    service = build(service_name, API_VERSION, credentials=credentials)
+    service = build(service_name, API_VERSION, http=authorized_http, cache_discovery=False)
     return service
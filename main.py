@@ -7,13 +7,21 @@ the matching images in a specified Google Drive folder.
 
 Key Functions:
 - `get_list_of_image_files`: Retrieves a list of image files (jpg, png, jpeg) from a local folder.
-- `extract_tags_property`: Extracts the 'Tags' metadata from a local image file using ExifTool.
-- `search_image_in_drive`: Searches for an image in a specific Google Drive folder by name.
+- `extract_tags_properties`: Extracts the 'Tags' metadata from local image files in batches using ExifTool.
+- `extract_all_tags`: Extracts the 'Tags' metadata from local image files using parallel ExifTool processes.
+- `escape_query_value`: Escapes a file or folder name for use in a Google Drive search query.
+- `execute_batch_with_retries`: Executes a Google Drive batch request, retrying rate limited requests.
+- `resolve_drive_folders`: Resolves the Google Drive folder IDs of all local folders, one depth at a time.
+- `build_image_search_query`: Builds the query for an image in a specific Google Drive folder by name.
+- `search_images_in_drive`: Searches for images in Google Drive using batch requests.
 - `update_description_of_drive_image`: Updates the description of an image file in Google Drive.
+- `resolve_all_drive_files`: Finds the Google Drive files of local images, using the sync cache where possible.
+- `submit_updates`: Executes update requests in concurrent Google Drive batch requests.
 - `create_description_from_tags`: Creates a description string from a list of tags.
 - `bulk_update_image_descriptions`: Performs batch processing to update image descriptions in Google Drive.
 
-The script uses Google Drive's batch request feature to handle bulk updates efficiently. It is triggered 
+The script uses Google Drive's batch request feature to handle bulk updates efficiently, and keeps a local
+cache of synchronized images so that unchanged images are skipped on later runs. It is triggered 
 from the `main` function, which initializes the Google Drive API service and processes all image files in 
 the local folder.
 
@@ -28,16 +36,48 @@ Usage:
 
 """
 
+import os
+import math
+import time
+import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import exiftool
 import google_api
+import sync_cache
+from exiftool.exceptions import ExifToolException
+
+if TYPE_CHECKING:
+    # Only needed for type annotations, as the API client library is loaded by `google_api`
+    from googleapiclient.http import HttpRequest
 
 
 # Constants for local folder path and Google Drive folder ID
 LOCAL_FOLDER_NAME: str = "images"
 IMAGE_FILE_EXTENSIONS: tuple[str, ...] = (".jpg", ".jpeg", ".png")
 GOOGLE_DRIVE_FOLDER_ID: str = ""
+# Maximum number of images read by ExifTool in a single call
+EXIFTOOL_BATCH_SIZE: int = 500
+# ExifTool arguments: group names, numeric values and skip scanning for JPEG trailers
+# (-fast2 would be faster, but stops reading PNG files at the image data, which some PNG
+# files store their metadata after)
+EXIFTOOL_COMMON_ARGS: list[str] = ["-G", "-n", "-fast"]
+# Maximum number of ExifTool processes reading images in parallel
+EXIFTOOL_MAX_WORKERS: int = min(8, (os.cpu_count() or 1) * 2)
+# Maximum number of folders looked up in a single Google Drive query
+DRIVE_FOLDER_QUERY_SIZE: int = 50
+# Maximum number of requests in a single Google Drive batch request
+DRIVE_BATCH_SIZE: int = 100
+# Maximum number of files returned per page of a Google Drive list request
+DRIVE_PAGE_SIZE: int = 1000
+# Maximum number of retries for Google Drive requests that are rate limited or fail temporarily
+DRIVE_MAX_RETRIES: int = 5
+RETRYABLE_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503)
+# Maximum number of Google Drive batch requests executed in parallel
+DRIVE_MAX_WORKERS: int = 4
 
 
 def get_list_of_image_paths(
@@ -45,86 +85,536 @@ def get_list_of_image_paths(
         extensions: tuple[str, ...] = IMAGE_FILE_EXTENSIONS
     ) -> list[str]:
     """
-    Retrieves all image paths within a specified directory, including nested folders.
+    Retrieves all unique image paths within a specified directory, including nested folders.
 
     Args:
     - directory (str): The root directory to search for images.
     - extensions (tuple): A tuple of file extensions to consider as images.
 
     Returns:
-    - list[str]: A list of paths to all images found.
+    - list[str]: A sorted list of normalised paths to all images found.
+    """
+    list_of_image_paths: list[str] = []
+    if not os.path.isdir(directory):
+        return list_of_image_paths
+
+    # Walk the directory tree with os.scandir, which filters entries by name without
+    # creating a Path object or calling stat for every file
+    directories: list[str] = [directory]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    # Normalise the path (e.g., './images/a.jpg' to 'images/a.jpg') the same way
+                    # as the paths reported by ExifTool, so both can be used as lookup keys
+                    list_of_image_paths.append(os.path.normpath(entry.path))
+
+    # Keep a single path for image files reachable through several paths (e.g., symlinks),
+    # preferring the path of the file itself over the symlinks pointing to it, and sort the
+    # paths so that images in the same folder are processed together
+    unique_image_paths: dict[str, str] = {}
+    for image_path in sorted(list_of_image_paths, key=lambda path: (os.path.islink(path), path)):
+        unique_image_paths.setdefault(os.path.realpath(image_path), image_path)
+    return sorted(unique_image_paths.values())
+
+
+def extract_tags_properties(
+        image_paths: list[str],
+        chunk_size: int = EXIFTOOL_BATCH_SIZE
+    ) -> dict[str, list[str]]:
+    """
+    Extract the 'Tags' property from the metadata of many images using a single ExifTool process.
+
+    Images that ExifTool can't read (e.g., empty, truncated or deleted files) are reported and
+    left out of the result, so they are treated as having no tags instead of failing the batch.
+
+    Args:
+        image_paths (list[str]): Paths to the image files.
+        chunk_size (int): Maximum number of images passed to ExifTool per call.
+
+    Returns:
+        dict[str, list[str]]: Tags/keywords found in the metadata, keyed by image path.
+    """
+    tags_by_path: dict[str, list[str]] = {}
+
+    # Start a single ExifTool process and keep it open for all images. ExifTool exits with an
+    # error status if any image of a call can't be read, so don't raise on it and check the
+    # result of each image instead
+    with exiftool.ExifToolHelper(common_args=EXIFTOOL_COMMON_ARGS, check_execute=False) as et:
+        for start in range(0, len(image_paths), chunk_size):
+            chunk: list[str] = image_paths[start:start + chunk_size]
+            try:
+                # Extract only the keywords for the whole chunk in one ExifTool call
+                metadata = et.get_tags(chunk, tags=["IPTC:Keywords"]) or []
+            except ExifToolException:
+                # Read the images of the chunk one at a time, so only the broken ones are missed
+                metadata = []
+                for image_path in chunk:
+                    try:
+                        metadata.extend(et.get_tags(image_path, tags=["IPTC:Keywords"]) or [])
+                    except ExifToolException as error:
+                        print(f"- ExifTool failed to read {image_path}: {error}")
+
+            for image_metadata in metadata:
+                if "ExifTool:Error" in image_metadata:
+                    print(
+                        f"- ExifTool failed to read {image_metadata.get('SourceFile')}: "
+                        f"{image_metadata['ExifTool:Error']}"
+                    )
+                    continue
+                # Get the 'IPTC:Keywords' field from the metadata
+                tags: list[str] | str = image_metadata.get("IPTC:Keywords", [])
+                # ExifTool returns a plain value instead of a list for a single keyword
+                if not isinstance(tags, list):
+                    tags = [tags]
+                # ExifTool reports paths with forward slashes, so normalise them the same way
+                # as `get_list_of_image_paths` does for lookups
+                tags_by_path[os.path.normpath(image_metadata["SourceFile"])] = tags
+
+    return tags_by_path
+
+
+def extract_all_tags(
+        image_paths: list[str],
+        chunk_size: int = EXIFTOOL_BATCH_SIZE,
+        max_workers: int = EXIFTOOL_MAX_WORKERS
+    ) -> dict[str, list[str]]:
+    """
+    Extract the 'Tags' property from the metadata of many images using parallel ExifTool processes.
+
+    The images are split into shards of at least `chunk_size` images, and each shard is read by
+    its own ExifTool process in a worker thread, so disk reads overlap with ExifTool's processing.
+
+    Args:
+        image_paths (list[str]): Paths to the image files.
+        chunk_size (int): Maximum number of images passed to ExifTool per call.
+        max_workers (int): Maximum number of ExifTool processes running at the same time.
+
+    Returns:
+        dict[str, list[str]]: Tags/keywords found in the metadata, keyed by image path.
     """
-    initial_dir = Path(directory)
-    list_of_image_paths = [
-        str(path) for path in initial_dir.rglob("*")
-        if path.suffix.lower() in extensions
+    if not image_paths:
+        return {}
+
+    # Only start as many ExifTool processes as there are full chunks of images
+    shard_count: int = min(max_workers, math.ceil(len(image_paths) / chunk_size))
+    shard_size: int = math.ceil(len(image_paths) / shard_count)
+    shards: list[list[str]] = [
+        image_paths[start:start + shard_size]
+        for start in range(0, len(image_paths), shard_size)
     ]
-    return list_of_image_paths
 
+    tags_by_path: dict[str, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=shard_count) as executor:
+        for shard_tags_by_path in executor.map(
+                lambda shard: extract_tags_properties(shard, chunk_size), shards):
+            tags_by_path.update(shard_tags_by_path)
+
+    return tags_by_path
 
-def extract_tags_property(image_path: str) -> list[str]:
+
+def escape_query_value(value: str) -> str:
     """
-    Extract the 'Tags' property from the image's metadata using ExifTool.
+    Escape a value for use inside a quoted string of a Google Drive search query.
 
     Args:
-        image_path (str): Path to the image file.
+        value (str): Value to escape, such as a file or folder name.
 
     Returns:
-        list[str]: Tags/keywords found in the image metadata.
+        str: Value with backslashes and single quotes escaped.
     """
-    with exiftool.ExifTool() as et:
-        # Extract metadata from the image
-        metadata = et.execute_json(image_path)
-    # Get the 'IPTC:Keywords' field from the metadata
-    tags: list[str] = metadata[0].get("IPTC:Keywords", [])
-    return tags
+    return value.replace("\\", "\\\\").replace("'", "\\'")
 
 
-def search_image_in_drive(
+def execute_batch_with_retries(
         service,
+        requests: dict[str, "HttpRequest"],
+        callback,
+        max_retries: int = DRIVE_MAX_RETRIES,
+        http=None
+    ) -> None:
+    """
+    Execute requests in a Google Drive batch request, retrying rate limited and failed requests.
+
+    Requests that fail with a retryable status code (such as HTTP 429) are sent again in a
+    follow-up batch after an exponential backoff, honouring the 'Retry-After' header if present.
+    If the whole batch is rejected with a retryable status code, all of its requests are sent
+    again in the same way.
+
+    Args:
+        service: Google Drive API service instance.
+        requests (dict[str, HttpRequest]): Requests to execute, keyed by request ID.
+        callback: Callback function called once with the final response or exception of each request.
+        max_retries (int): Maximum number of times a request is retried.
+        http: HTTP connection to send the batch with, instead of the one of the service.
+    """
+    # Imported here, as the API client library is loaded by `google_api` when creating the service
+    from googleapiclient.errors import HttpError  # pylint: disable=import-outside-toplevel
+
+    def is_retryable(exception) -> bool:
+        return isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUS_CODES
+
+    def get_retry_after(exception) -> float:
+        header: str = exception.resp.get('retry-after', "")
+        return float(header) if header.isdigit() else 0
+
+    pending_requests: dict[str, HttpRequest] = requests
+
+    for attempt in range(max_retries + 1):
+        retry_requests: dict[str, HttpRequest] = {}
+        retry_after: float = 0
+
+        def retry_callback(request_id, response, exception) -> None:
+            nonlocal retry_after
+            if is_retryable(exception) and attempt < max_retries:
+                retry_requests[request_id] = pending_requests[request_id]
+                retry_after = max(retry_after, get_retry_after(exception))
+            else:
+                callback(request_id, response, exception)
+
+        batch = service.new_batch_http_request(callback=retry_callback)
+        for request_id, request in pending_requests.items():
+            batch.add(request, request_id=request_id)
+
+        try:
+            batch.execute(http=http)
+        except HttpError as error:
+            # The whole batch was rejected before any callback ran, so retry all of its requests
+            if not is_retryable(error) or attempt == max_retries:
+                raise
+            retry_requests = dict(pending_requests)
+            retry_after = get_retry_after(error)
+
+        if not retry_requests:
+            return
+
+        # Back off exponentially before retrying the failed requests
+        delay: float = max(min(2 ** attempt, 32), retry_after)
+        print(f"- Retrying {len(retry_requests)} batch request(s) in {delay:g} seconds")
+        time.sleep(delay)
+        pending_requests = retry_requests
+
+
+def resolve_drive_folders(
+        service,
+        image_paths: list[str],
+        root_folder_id: str = GOOGLE_DRIVE_FOLDER_ID,
+        chunk_size: int = DRIVE_FOLDER_QUERY_SIZE
+    ) -> dict[tuple[str, str], str]:
+    """
+    Resolve the Google Drive folder IDs of every folder in the given image paths, one depth at a time.
+
+    Instead of listing each folder of each image path separately, all folders found at the same
+    depth are looked up together with a single query per chunk of folders.
+
+    Args:
+        service: Google Drive API service instance.
+        image_paths (list[str]): Image paths relative to the local folder.
+        root_folder_id (str): Google Drive folder ID to start searching within.
+        chunk_size (int): Maximum number of folders looked up in a single query.
+
+    Returns:
+        dict[tuple[str, str], str]: Folder IDs keyed by (parent folder ID, folder name).
+    """
+    folder_cache: dict[tuple[str, str], str] = {}
+
+    # Collect every unique folder path (as a tuple of parts) across all image paths
+    folder_paths: set[tuple[str, ...]] = set()
+    for image_path in image_paths:
+        path_parts = Path(image_path).parts[:-1]  # Exclude the last part (the file name)
+        for depth in range(1, len(path_parts) + 1):
+            folder_paths.add(tuple(path_parts[:depth]))
+
+    # Folder IDs of the folder paths resolved so far, starting with the root folder
+    folder_ids: dict[tuple[str, ...], str] = {(): root_folder_id}
+    max_depth: int = max((len(folder_path) for folder_path in folder_paths), default=0)
+
+    for depth in range(1, max_depth + 1):
+        # Only look up folders whose parent folder has been found
+        lookups: list[tuple[str, str]] = sorted({
+            (folder_ids[folder_path[:-1]], folder_path[-1])
+            for folder_path in folder_paths
+            if len(folder_path) == depth and folder_path[:-1] in folder_ids
+        })
+
+        for start in range(0, len(lookups), chunk_size):
+            chunk = lookups[start:start + chunk_size]
+            parent_ids: list[str] = sorted({parent_id for parent_id, _ in chunk})
+            names: list[str] = sorted({name for _, name in chunk})
+
+            parents_query: str = " or ".join(f"'{parent_id}' in parents" for parent_id in parent_ids)
+            names_query: str = " or ".join(f"name = '{escape_query_value(name)}'" for name in names)
+            query = (
+                f"({parents_query}) and ({names_query}) "
+                f"and mimeType = 'application/vnd.google-apps.folder'"
+            )
+
+            page_token: str | None = None
+            while True:
+                results = service.files().list(
+                    q=query,
+                    fields="nextPageToken, files(id, name, parents)",
+                    spaces="drive",
+                    corpora="user",
+                    pageSize=DRIVE_PAGE_SIZE,
+                    pageToken=page_token
+                ).execute(num_retries=DRIVE_MAX_RETRIES)
+
+                for folder in results.get('files', []):
+                    for parent_id in folder.get('parents', []):
+                        # Keep the first match, as a folder lookup by name would
+                        folder_cache.setdefault((parent_id, folder['name']), folder['id'])
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
+        # Record the IDs of the folder paths found at this depth
+        for folder_path in folder_paths:
+            if len(folder_path) == depth and folder_path[:-1] in folder_ids:
+                folder_id = folder_cache.get((folder_ids[folder_path[:-1]], folder_path[-1]))
+                if folder_id:
+                    folder_ids[folder_path] = folder_id
+
+    return folder_cache
+
+
+def build_image_search_query(
         image_path: str,
+        folder_cache: dict[tuple[str, str], str],
         root_folder_id: str = GOOGLE_DRIVE_FOLDER_ID
-    ) -> list[dict[str, str]]:
+    ) -> str | None:
     """
-    Search for an image in Google Drive by mirroring the structure of the local path.
+    Build the Google Drive query for an image by mirroring the structure of the local path.
 
     Args:
-        service: Google Drive API service instance.
+        image_path (str): Local file path to mirror in Google Drive.
+        folder_cache (dict[tuple[str, str], str]): Folder IDs resolved by `resolve_drive_folders`.
         root_folder_id (str): Google Drive folder ID to start searching within.
-        local_path (str): Local file path to mirror in Google Drive.
 
     Returns:
-        list[dict[str, str]]: List of files found in Google Drive with matching name and structure.
+        str | None: Query for the image file, or None if the folder structure doesn't match.
     """
     # Split the local path into parts for each folder level
-    path_parts = image_path.split('/')
+    path_parts = Path(image_path).parts
 
     # Initialize the folder ID to start with
     current_folder_id = root_folder_id
 
     # Iterate through the path parts, assuming the last part is the file name
     for part in path_parts[:-1]:  # Exclude the last part (the file name)
-        query = f"'{current_folder_id}' in parents and name = '{part}' \
-                and mimeType = 'application/vnd.google-apps.folder'"
-        results = service.files().list(q=query, fields="files(id, name)").execute()
-        folders = results.get('files', [])
+        folder_id = folder_cache.get((current_folder_id, part))
 
-        if not folders:
+        if not folder_id:
             print(f"Folder '{part}' not found in the expected structure.")
-            return []  # If any folder in the path isn't found, the structure doesn't match
+            return None  # If any folder in the path isn't found, the structure doesn't match
         else:
-            current_folder_id = folders[0]['id']  # Move to the next folder
+            current_folder_id = folder_id  # Move to the next folder
 
     # Final search for the image file in the last matched folder
     image_name = path_parts[-1]
     image_query = (
-        f"'{current_folder_id}' in parents and name contains '{image_name}' "
+        f"'{current_folder_id}' in parents and name contains '{escape_query_value(image_name)}' "
         f"and mimeType contains 'image/'"
     )
-    image_results = service.files().list(q=image_query, fields="files(id, name)").execute()
-    image_files = image_results.get('files', [])
+    return image_query
+
+
+def search_images_in_drive(
+        service,
+        image_paths: list[str],
+        folder_cache: dict[tuple[str, str], str],
+        root_folder_id: str = GOOGLE_DRIVE_FOLDER_ID,
+        batch_size: int = DRIVE_BATCH_SIZE
+    ) -> dict[str, list[dict[str, str]]]:
+    """
+    Search for many images in Google Drive using batch requests.
+
+    Args:
+        service: Google Drive API service instance.
+        image_paths (list[str]): Local file paths to mirror in Google Drive.
+        folder_cache (dict[tuple[str, str], str]): Folder IDs resolved by `resolve_drive_folders`.
+        root_folder_id (str): Google Drive folder ID to start searching within.
+        batch_size (int): Maximum number of search requests per batch.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: Files found in Google Drive, keyed by image path.
+    """
+    drive_files_by_path: dict[str, list[dict[str, str]]] = {}
+    searches: list[tuple[str, str]] = []
+
+    for image_path in image_paths:
+        image_query = build_image_search_query(image_path, folder_cache, root_folder_id)
+        if image_query is None:
+            drive_files_by_path[image_path] = []
+        else:
+            searches.append((image_path, image_query))
+
+    # Pages of search results still to be requested, as (search index, page token)
+    pages: list[tuple[int, str | None]] = [(index, None) for index in range(len(searches))]
+    next_pages: list[tuple[int, str | None]] = []
+
+    def search_callback(request_id, response, exception) -> None:
+        index = int(request_id)
+        image_path = searches[index][0]
+        if exception:
+            print(f"- Error in search request for {image_path}: {exception}")
+            drive_files_by_path.setdefault(image_path, [])
+        else:
+            drive_files_by_path.setdefault(image_path, []).extend(response.get('files', []))
+            # Request the next page of results in the following round of batches
+            if response.get('nextPageToken'):
+                next_pages.append((index, response['nextPageToken']))
+
+    while pages:
+        for start in range(0, len(pages), batch_size):
+            requests: dict[str, HttpRequest] = {
+                str(index): service.files().list(
+                    q=searches[index][1],
+                    fields="nextPageToken, files(id, name, description, parents)",
+                    spaces="drive",
+                    corpora="user",
+                    pageSize=DRIVE_PAGE_SIZE,
+                    pageToken=page_token
+                )
+                for index, page_token in pages[start:start + batch_size]
+            }
+            execute_batch_with_retries(service, requests, search_callback)
+
+        pages = next_pages.copy()
+        next_pages.clear()
+
+    return drive_files_by_path
+
+
+def resolve_all_drive_files(
+        service,
+        image_paths: list[str],
+        cached_entries: dict[str, tuple[list[str], float, str | None]],
+        local_folder_name: str = LOCAL_FOLDER_NAME,
+        root_folder_id: str = GOOGLE_DRIVE_FOLDER_ID
+    ) -> dict[str, list[dict[str, str]]]:
+    """
+    Find the Google Drive files of all given local images.
+
+    Images found in the local cache reuse their cached Google Drive file IDs and descriptions,
+    while all other images are searched for in Google Drive using batched folder lookups and
+    search requests.
+
+    Args:
+        service: Google Drive API service instance.
+        image_paths (list[str]): Paths to the local image files.
+        cached_entries (dict[str, tuple[list[str], float, str | None]]): Entries loaded from the sync cache.
+        local_folder_name (str): Path to the folder containing local images.
+        root_folder_id (str): ID of the Google Drive folder to search in ("" for the whole drive).
+
+    Returns:
+        dict[str, list[dict[str, str]]]: Files found in Google Drive, keyed by local image path.
+    """
+    # Remove the local folder name from the paths of the uncached images
+    relative_image_paths: dict[str, str] = {
+        str(Path(image_path).relative_to(local_folder_name)): image_path
+        for image_path in image_paths if image_path not in cached_entries
+    }
+
+    # Resolve the Google Drive folder structure for all uncached images up front
+    folder_cache: dict[tuple[str, str], str] = resolve_drive_folders(
+        service,
+        list(relative_image_paths),
+        root_folder_id
+    )
 
-    return image_files
+    # Search for all uncached images in Google Drive using batch requests
+    drive_files_by_relative_path: dict[str, list[dict[str, str]]] = search_images_in_drive(
+        service,
+        list(relative_image_paths),
+        folder_cache,
+        root_folder_id
+    )
+    drive_files_by_path: dict[str, list[dict[str, str]]] = {
+        relative_image_paths[relative_image_path]: drive_files
+        for relative_image_path, drive_files in drive_files_by_relative_path.items()
+    }
+
+    # Reuse the Google Drive files of the cached images instead of searching for them again,
+    # along with the description last written to them
+    for image_path in image_paths:
+        if image_path in cached_entries:
+            drive_ids, _, description = cached_entries[image_path]
+            drive_files_by_path[image_path] = [
+                {"id": drive_id, "description": description} for drive_id in drive_ids
+            ]
+
+    return drive_files_by_path
+
+
+def submit_updates(
+        service,
+        credentials,
+        update_requests: dict[str, "HttpRequest"],
+        callback,
+        batch_size: int = DRIVE_BATCH_SIZE,
+        max_workers: int = DRIVE_MAX_WORKERS
+    ) -> None:
+    """
+    Execute update requests in concurrent Google Drive batch requests.
+
+    HTTP connections are not thread-safe, so every worker thread creates its own authorized
+    connection once and reuses it for all the batches it executes. If a batch fails as a whole,
+    the callback receives the error for each of its requests that didn't get a response.
+
+    Args:
+        service: Google Drive API service instance.
+        credentials (Credentials): OAuth2 credentials used to authorize the worker connections.
+        update_requests (dict[str, HttpRequest]): Update requests to execute, keyed by request ID.
+        callback: Callback function called with the final response or exception of each request.
+        batch_size (int): Maximum number of requests per batch.
+        max_workers (int): Maximum number of batch requests executed in parallel.
+    """
+    # Split the update requests into batches within Google Drive's limit of requests per batch
+    update_request_items = list(update_requests.items())
+    update_batches: list[dict[str, HttpRequest]] = [
+        dict(update_request_items[start:start + batch_size])
+        for start in range(0, len(update_request_items), batch_size)
+    ]
+
+    if not update_batches:
+        return
+
+    # Keep track of the requests that got their final response or exception
+    completed_request_ids: set[str] = set()
+
+    def completed_callback(request_id, response, exception) -> None:
+        completed_request_ids.add(request_id)
+        callback(request_id, response, exception)
+
+    # HTTP connection of the current worker thread
+    thread_data = threading.local()
+
+    def create_worker_http() -> None:
+        thread_data.http = google_api.create_authorized_http(credentials)
+
+    def execute_update_batch(update_batch: dict[str, "HttpRequest"]) -> None:
+        execute_batch_with_retries(service, update_batch, completed_callback, http=thread_data.http)
+
+    # Execute the batch requests concurrently, retrying rate limited requests
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(update_batches)),
+            initializer=create_worker_http) as executor:
+        futures = [
+            executor.submit(execute_update_batch, update_batch)
+            for update_batch in update_batches
+        ]
+        for future, update_batch in zip(futures, update_batches):
+            try:
+                future.result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # Report the error for the requests of the batch that didn't complete
+                for request_id in update_batch:
+                    if request_id not in completed_request_ids:
+                        callback(request_id, None, error)
 
 
 def create_description_from_tags(tags: list[str]) -> str:
@@ -137,12 +627,9 @@ def create_description_from_tags(tags: list[str]) -> str:
     Returns:
         str: Formatted description string.
     """
-    new_description: str = ""
-    # Append each tag to the description string, separated by commas
-    for tag in tags:
-        new_description += f"{tag}, "
-    # Remove trailing comma and space
-    new_description = new_description[:-2]
+    # Join the tags into the description string, separated by commas
+    # (ExifTool returns numeric keywords as numbers, so convert them to strings)
+    new_description: str = ", ".join(map(str, tags))
     return new_description
 
 
@@ -163,16 +650,20 @@ def batch_callback(request_id, response, exception) -> None:
 
 def bulk_update_image_descriptions(
         drive_service,
-        local_folder_name: str = LOCAL_FOLDER_NAME
+        credentials,
+        local_folder_name: str = LOCAL_FOLDER_NAME,
+        root_folder_id: str = GOOGLE_DRIVE_FOLDER_ID
     ) -> dict[str, list[str]]:
     """
     Perform a bulk update of image descriptions in Google Drive based on local image metadata.
 
     Args:
-        local_folder_name (str): Path to the folder containing local images.
         drive_service: Google Drive API service instance.
+        credentials (Credentials): OAuth2 credentials the Google Drive service was created with.
+        local_folder_name (str): Path to the folder containing local images.
+        root_folder_id (str): ID of the Google Drive folder to update ("" for the whole drive).
     """
-    list_of_image_paths: list[str] = get_list_of_image_paths()
+    list_of_image_paths: list[str] = get_list_of_image_paths(local_folder_name)
     successful_image_paths: list[str] = []
     failed_image_paths: list[str] = []
 
@@ -183,41 +674,105 @@ def bulk_update_image_descriptions(
         print(f"{print_prefix} Failed: No image files found in the folder.")
         return
 
-    # Create a batch request object for Google Drive API
-    batch = drive_service.new_batch_http_request(callback=batch_callback)
+    # Load the images synchronized by previous runs from the local cache
+    with closing(sync_cache.open_cache()) as cache_connection:
+        cached_entries: dict[str, tuple[list[str], float, str | None]] = sync_cache.load_entries(
+            cache_connection,
+            root_folder_id
+        )
+    mtimes: dict[str, float] = {
+        image_path: os.stat(image_path).st_mtime for image_path in list_of_image_paths
+    }
 
-    for image_path in list_of_image_paths:
-        print(f"In Progress: {image_path}")
+    # Skip the images that haven't changed since their last successful update
+    unchanged_image_paths: set[str] = {
+        image_path for image_path in list_of_image_paths
+        if image_path in cached_entries and cached_entries[image_path][1] == mtimes[image_path]
+    }
+    changed_image_paths: list[str] = [
+        image_path for image_path in list_of_image_paths
+        if image_path not in unchanged_image_paths
+    ]
+
+    # Extract the metadata (tags) from the changed local image files and find their files in
+    # Google Drive at the same time, as the two phases don't depend on each other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tags_future = executor.submit(extract_all_tags, changed_image_paths)
+        drive_files_future = executor.submit(
+            resolve_all_drive_files,
+            drive_service,
+            changed_image_paths,
+            cached_entries,
+            local_folder_name,
+            root_folder_id
+        )
+        tags_by_path: dict[str, list[str]] = tags_future.result()
+        drive_files_by_path: dict[str, list[dict[str, str]]] = drive_files_future.result()
+
+    # Keep track of the files that are up to date in Google Drive, to cache them afterwards
+    updated_file_ids: set[str] = set()
+    batched_file_ids: dict[str, list[str]] = {}
+    batched_descriptions: dict[str, str] = {}
+
+    def update_callback(request_id, response, exception) -> None:
+        batch_callback(request_id, response, exception)
+        if not exception:
+            updated_file_ids.add(response.get('id'))
+
+    # Collect the update requests to send to Google Drive API in a batch, keyed by request ID
+    update_requests: dict[str, HttpRequest] = {}
+    # Request bodies shared by all images with the same tags
+    body_cache: dict[tuple[str, ...], dict[str, str]] = {}
+
+    for local_image_path in list_of_image_paths:
+        print(f"In Progress: {local_image_path}")
 
-        # Extract the metadata (tags) from the local image file
-        image_tags: list[str] = extract_tags_property(image_path)
         # Remove the local folder name from the image path
-        image_path = image_path.replace(f"{local_folder_name}/", "")
+        image_path = str(Path(local_image_path).relative_to(local_folder_name))
+
+        if local_image_path in unchanged_image_paths:
+            # The image is still in sync with Google Drive since its last successful update
+            successful_image_paths.append(image_path)
+            print(f"{print_prefix} Skipped: Image unchanged since the last update")
+            print()
+            continue
+
+        # Look up the metadata (tags) extracted from the local image file
+        image_tags: list[str] = tags_by_path.get(local_image_path, [])
 
         if image_tags:
             print(f"{print_prefix} Success: Extracted tags")
 
-            new_description: str = create_description_from_tags(image_tags)
+            # Reuse the request body of images with the same tags instead of building it again
+            tags_key: tuple[str, ...] = tuple(image_tags)
+            if tags_key not in body_cache:
+                body_cache[tags_key] = {"description": create_description_from_tags(image_tags)}
+            body: dict[str, str] = body_cache[tags_key]
 
-            # Search for the corresponding file in Google Drive
-            drive_files: list[dict[str, str]] = search_image_in_drive(
-                drive_service,
-                image_path
-            )
+            # Look up the corresponding files found in Google Drive
+            drive_files: list[dict[str, str]] = drive_files_by_path.get(local_image_path, [])
 
             if drive_files:
                 print(f"{print_prefix} Success: File found in Google Drive")
+                batched_descriptions[local_image_path] = body["description"]
 
                 for drive_file in drive_files:
                     file_id: str = drive_file['id']
+                    batched_file_ids.setdefault(local_image_path, []).append(file_id)
+
+                    # Skip the update if the description in Google Drive is already up to date
+                    if drive_file.get('description') == body["description"]:
+                        updated_file_ids.add(file_id)
+                        print(f"{print_prefix} Skipped: Description already up to date")
+                        continue
+
                     # Prepare the update request to modify the description
                     request = drive_service.files().update(
                         fileId=file_id,
-                        body={"description": new_description}
+                        body=body
                     )
                     # Add the request to the batch
-                    batch.add(request)
-                    successful_image_paths.append(image_path)
+                    update_requests[str(len(update_requests))] = request
                     print(f"{print_prefix} Success: File added to batch processing")
             else:
                 failed_image_paths.append(image_path)
@@ -233,8 +788,30 @@ def bulk_update_image_descriptions(
         "-"*100 + "\n"
     print(print_batch_processing)
 
-    # Execute the batch request to update all files
-    batch.execute()
+    try:
+        # Execute the batch requests to update all files
+        submit_updates(drive_service, credentials, update_requests, update_callback)
+    finally:
+        # Cache the images whose Google Drive files are all up to date, even if the updates
+        # were interrupted, and drop the images for which any update failed, so that all of
+        # their files are updated again on the next run
+        with closing(sync_cache.open_cache()) as cache_connection:
+            sync_cache.save_entries(cache_connection, root_folder_id, {
+                image_path: (
+                    file_ids if all(file_id in updated_file_ids for file_id in file_ids) else [],
+                    mtimes[image_path],
+                    batched_descriptions[image_path]
+                )
+                for image_path, file_ids in batched_file_ids.items()
+            })
+
+    # An image is synchronized successfully once all of its Google Drive files are up to date
+    for local_image_path, file_ids in batched_file_ids.items():
+        image_path = str(Path(local_image_path).relative_to(local_folder_name))
+        if all(file_id in updated_file_ids for file_id in file_ids):
+            successful_image_paths.append(image_path)
+        else:
+            failed_image_paths.append(image_path)
 
     return {
         "successful_image_paths": successful_image_paths,
@@ -264,9 +841,13 @@ def main() -> None:
     print(print_script_start)
 
     # Initialize the Google Drive API service
-    google_drive_service = google_api.create_service("drive")
+    google_drive_credentials = google_api.get_credentials("drive")
+    google_drive_service = google_api.create_service("drive", google_drive_credentials)
     # Perform bulk update of image descriptions
-    result: dict[str, list[str]] = bulk_update_image_descriptions(google_drive_service)
+    result: dict[str, list[str]] = bulk_update_image_descriptions(
+        google_drive_service,
+        google_drive_credentials
+    )
 
     # Export result of failed image paths to a .txt file
     if result["failed_image_paths"]:
@@ -0,0 +1,114 @@
+"""
+sync_cache.py
+
+This module provides a small SQLite cache of local image paths and the Google Drive files they were
+synchronized with. It allows repeated runs of the script to skip images that haven't changed since
+their last successful update and to reuse known Google Drive file IDs instead of searching for them.
+
+Key Functions:
+- `open_cache`: Opens the cache database, creating the table if needed.
+- `load_entries`: Loads the cached entries of a Google Drive root folder from the database.
+- `save_entries`: Replaces the cached entries of the given image paths.
+
+Each entry consists of the local image path, one of the Google Drive file IDs it was synchronized
+with, the modification time of the local file at the time of the update, the description written
+to the Google Drive file, and the Google Drive root folder the image was synchronized under.
+Entries of other root folders are ignored, so changing the target folder causes a full sync.
+
+Constants:
+- `CACHE_FILE`: Path to the SQLite database file where the cache is stored.
+
+Dependencies:
+- sqlite3
+
+"""
+
+import sqlite3
+
+# Constant for the cache database file
+CACHE_FILE: str = "sync_cache.db"
+
+
+def open_cache(cache_file: str = CACHE_FILE) -> sqlite3.Connection:
+    """
+    Opens the cache database and creates the cache table if it doesn't exist yet.
+
+    Args:
+        cache_file (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: Connection to the cache database.
+    """
+    connection = sqlite3.connect(cache_file)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_cache ("
+            "local_path TEXT NOT NULL, "
+            "drive_id TEXT NOT NULL, "
+            "mtime REAL NOT NULL, "
+            "description TEXT, "
+            "root_folder_id TEXT, "
+            "PRIMARY KEY (local_path, drive_id))"
+        )
+        # Add the columns missing from caches created before they existed
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(sync_cache)")}
+        if "description" not in columns:
+            connection.execute("ALTER TABLE sync_cache ADD COLUMN description TEXT")
+        if "root_folder_id" not in columns:
+            connection.execute("ALTER TABLE sync_cache ADD COLUMN root_folder_id TEXT")
+    return connection
+
+
+def load_entries(
+        connection: sqlite3.Connection,
+        root_folder_id: str
+    ) -> dict[str, tuple[list[str], float, str | None]]:
+    """
+    Loads the cached entries synchronized under the given Google Drive root folder.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the cache database.
+        root_folder_id (str): ID of the Google Drive root folder ("" for the whole drive).
+
+    Returns:
+        dict[str, tuple[list[str], float, str | None]]: Google Drive file IDs, modification time
+        and last written description (None if unknown), keyed by local image path.
+    """
+    entries: dict[str, tuple[list[str], float, str | None]] = {}
+    for local_path, drive_id, mtime, description in connection.execute(
+            "SELECT local_path, drive_id, mtime, description FROM sync_cache "
+            "WHERE root_folder_id = ?", (root_folder_id,)):
+        drive_ids, _, _ = entries.setdefault(local_path, ([], mtime, description))
+        drive_ids.append(drive_id)
+    return entries
+
+
+def save_entries(
+        connection: sqlite3.Connection,
+        root_folder_id: str,
+        entries: dict[str, tuple[list[str], float, str | None]]
+    ) -> None:
+    """
+    Replaces the cached entries of the given image paths in a single transaction.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the cache database.
+        root_folder_id (str): ID of the Google Drive root folder the images were synchronized under.
+        entries (dict[str, tuple[list[str], float, str | None]]): Google Drive file IDs,
+            modification time and written description, keyed by local image path.
+            An empty list of file IDs removes the image from the cache.
+    """
+    with connection:
+        connection.executemany(
+            "DELETE FROM sync_cache WHERE local_path = ?",
+            [(local_path,) for local_path in entries]
+        )
+        connection.executemany(
+            "INSERT INTO sync_cache (local_path, drive_id, mtime, description, root_folder_id) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (local_path, drive_id, mtime, description, root_folder_id)
+                for local_path, (drive_ids, mtime, description) in entries.items()
+                for drive_id in drive_ids
+            ]
+        )